@@ -82,5 +82,31 @@ class ProfileAdmin(admin.ModelAdmin):
     Admin configuration for the Profile model.
     """
 
+    # Columns displayed in the profile list view
+    list_display = ("user", "first_name", "last_name")
+
+    # Fields used for searching profiles in the admin panel
+    search_fields = ("user__email",)
+
+    # Join the related user in the changelist query instead of per row
+    list_select_related = ("user",)
+
+    # Render the user as an id input instead of a <select> of every user
+    raw_id_fields = ("user",)
+
     class Meta:
         model = Profile
+
+    def get_queryset(self, request):
+        """
+        Return profiles with their user joined in a single query.
+        """
+        return super().get_queryset(request).select_related("user")
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        """
+        Narrow the user lookup on the change form to the columns it needs.
+        """
+        if db_field.name == "user":
+            kwargs["queryset"] = User.objects.only("id", "email")
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
@@ -0,0 +1,16 @@
+class ActivationTokenConverter:
+    """
+    Matches activation tokens (22 url-safe base64 characters, as issued
+    by secrets.token_urlsafe(16)).
+
+    Anything else fails URL resolution with a 404 before the view runs,
+    so malformed activation links never reach the cache.
+    """
+
+    regex = r"[A-Za-z0-9_\-]{22}"
+
+    def to_python(self, value):
+        return value
+
+    def to_url(self, value):
+        return value
@@ -1,19 +1,52 @@
 from datetime import timedelta
+from django.conf import settings
 from django.utils import timezone
 from django.contrib.auth import authenticate
+from django.contrib.auth.models import update_last_login
 from django.contrib.auth.password_validation import validate_password
 from django.shortcuts import get_object_or_404
 from django.core import exceptions
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.settings import api_settings
 
 from ...models.users import User, EmailChangeRequestModel, PasswordResetRequest
 from ...models.profiles import Profile
+from ...backends import EmailBackend
+from ...utils import hash_verification_code
 
 
-class RegistrationSerializer(serializers.ModelSerializer):
+class PasswordsMatchMixin:
+    """
+    Shared password checks for serializers that accept a new password.
+    """
+
+    def _check_passwords(self, password, confirmation, field="password"):
+        """
+        Ensures both passwords match, then checks password strength.
+        """
+        if password != confirmation:
+            raise serializers.ValidationError(
+                {"detail": "passwords doesn't match"}
+            )
+
+        self._check_password_strength(password, field)
+
+    def _check_password_strength(self, password, field="password"):
+        """
+        Runs Django's password validators (length, complexity, etc.)
+        and normalizes their errors to DRF format under `field`.
+        """
+        try:
+            validate_password(password)
+        except exceptions.ValidationError as e:
+            raise serializers.ValidationError({field: list(e.messages)})
+
+
+class RegistrationSerializer(PasswordsMatchMixin, serializers.ModelSerializer):
     """
     Handles user registration logic.
 
@@ -41,9 +74,21 @@ class RegistrationSerializer(serializers.ModelSerializer):
         )
         extra_kwargs = {
             # Prevent password from ever being exposed in responses
-            'password': {'write_only': True}
+            'password': {'write_only': True},
+            # Uniqueness is checked case-insensitively in validate_email
+            # instead of the model's exact-match UniqueValidator
+            'email': {'validators': []},
         }
 
+    def validate_email(self, value):
+        """
+        Rejects emails already registered in any letter case; served by
+        the case-insensitive unique index on User.email.
+        """
+        if User.objects.filter(email__lower=value.lower()).exists():
+            raise serializers.ValidationError(_("user with this email already exists."))
+        return value
+
     def validate(self, attrs):
         """
         Cross-field validation.
@@ -51,49 +96,37 @@ class RegistrationSerializer(serializers.ModelSerializer):
         - Ensures password and password2 match
         - Runs Django's password validators (length, complexity, etc.)
         """
-        if attrs.get("password") != attrs.get("password2"):
-            raise serializers.ValidationError(
-                {"detail": "passwords doesn't match"}
-            )
-
-        try:
-            validate_password(attrs.get("password"))
-        except exceptions.ValidationError as e:
-            # Normalize Django validation errors to DRF format
-            raise serializers.ValidationError(
-                {"password": list(e.messages)}
-            )
-
+        self._check_passwords(attrs.get("password"), attrs.get("password2"))
         return super().validate(attrs)
 
     def create(self, validated_data):
         """
-        Creates User and updates the related Profile.
+        Creates User and its Profile.
+
+        Called inside the view's transaction, so both INSERTs roll back
+        together.
 
         Workflow:
         1. Extract profile-related fields
         2. Remove password confirmation field
-        3. Create user via custom manager (handles hashing)
-        4. Update auto-created Profile instance
+        3. Create the user through the custom manager, which hands the
+           profile fields to the post_save signal that inserts the Profile
         """
 
         # Extract Profile-related fields
-        first_name = validated_data.pop('first_name')
-        last_name = validated_data.pop('last_name')
+        profile_data = {
+            "first_name": validated_data.pop('first_name'),
+            "last_name": validated_data.pop('last_name'),
+        }
 
         # password2 is not stored anywhere
         validated_data.pop('password2')
 
-        # Create User using custom manager
-        user = User.objects.create_user(**validated_data)
-
-        # Profile is assumed to be created via post_save signal
-        profile = user.profile
-        profile.first_name = first_name
-        profile.last_name = last_name
-        profile.save()
-
-        return user
+        return User.objects.create_user(
+            password=validated_data.pop('password'),
+            profile_data=profile_data,
+            **validated_data,
+        )
 
 
 class ActivationResendSerializer(serializers.Serializer):
@@ -110,8 +143,18 @@ class ActivationResendSerializer(serializers.Serializer):
         """
         email = attrs.get("email")
 
-        # Fetch user or fail with 404-style error
-        user = get_object_or_404(User, email=email)
+        # Fetch user (with profile names joined) or fail with 404-style error
+        user = get_object_or_404(
+            User.objects.select_related("profile").only(
+                "id",
+                "email",
+                "is_active",
+                "is_verified",
+                "profile__first_name",
+                "profile__last_name",
+            ),
+            email__lower=email.lower(),
+        )
         full_name = user.profile.get_full_name()
         if user.is_verified:
             raise serializers.ValidationError(
@@ -129,17 +172,57 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     Extends JWT token response with basic user identifiers.
     """
 
+    # Called directly instead of walking AUTHENTICATION_BACKENDS through
+    # django.contrib.auth.authenticate, while it is the only backend
+    backend = EmailBackend()
+    backend_path = f"{EmailBackend.__module__}.{EmailBackend.__name__}"
+
     def validate(self, attrs):
         """
+        Authenticates the user and builds the token pair.
+
         Adds user_id and user_email to JWT response payload.
         """
-        validated_data = super().validate(attrs)
+        # EmailBackend alone: call it directly; otherwise let SimpleJWT run
+        # authenticate() across every configured backend
+        if list(settings.AUTHENTICATION_BACKENDS) == [self.backend_path]:
+            validated_data = self._validate_with_backend(attrs)
+        else:
+            validated_data = super().validate(attrs)
+
         validated_data['user_email'] = self.user.email
         validated_data['user_id'] = self.user.id
         return validated_data
 
+    def _validate_with_backend(self, attrs):
+        """
+        TokenObtainPairSerializer.validate with EmailBackend called directly.
+        """
+        # Single fetch (credential columns only); reused for every step below
+        user = self.user = self.backend.authenticate(
+            self.context.get("request"),
+            username=attrs[self.username_field],
+            password=attrs["password"],
+        )
+
+        if not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(
+                self.error_messages["no_active_account"],
+                "no_active_account",
+            )
 
-class ChangePasswordSerializer(serializers.Serializer):
+        refresh = self.get_token(user)
+
+        if api_settings.UPDATE_LAST_LOGIN:
+            update_last_login(None, user)
+
+        return {
+            "refresh": str(refresh),
+            "access": str(refresh.access_token),
+        }
+
+
+class ChangePasswordSerializer(PasswordsMatchMixin, serializers.Serializer):
     """
     Handles password change for authenticated users.
     """
@@ -153,18 +236,11 @@ class ChangePasswordSerializer(serializers.Serializer):
         - Ensures new passwords match
         - Enforces Django password validation rules
         """
-        if attrs.get("new_password") != attrs.get("new_password1"):
-            raise serializers.ValidationError(
-                {"detail": "passwords doesn't match"}
-            )
-
-        try:
-            validate_password(attrs.get("new_password"))
-        except exceptions.ValidationError as e:
-            raise serializers.ValidationError(
-                {"new_password": list(e.messages)}
-            )
-
+        self._check_passwords(
+            attrs.get("new_password"),
+            attrs.get("new_password1"),
+            field="new_password",
+        )
         return super().validate(attrs)
 
 
@@ -188,20 +264,22 @@ class ChangeEmailSerializer(serializers.Serializer):
         request = self.context.get("request")
         user = request.user
 
-        # Normalize emails to lowercase for comparison
-        old_email = attrs.get("old_email").lower()
-        new_email = attrs.get("new_email").lower()
+        # Normalize every email to lowercase once for comparison
+        current_email = user.email.lower()
+        old_email = attrs["old_email"].lower()
+        new_email = attrs["new_email"].lower()
 
         # Check if old email matches the user's current email
-        if user.email.lower() != old_email:
+        if current_email != old_email:
             raise serializers.ValidationError("The old email is invalid!")
 
         # Check if new email is different from the current email
-        if user.email.lower() == new_email:
+        if current_email == new_email:
             raise serializers.ValidationError("New email cannot be the same as the current email!")
 
-        # Check if new email is already in use by another user
-        if User.objects.filter(email=new_email).exists():
+        # Check if new email is already in use by another user;
+        # served by the case-insensitive unique index on User.email
+        if User.objects.filter(email__lower=new_email).exists():
             raise serializers.ValidationError("This email is already in use!")
 
         # Save normalized new email back into attrs
@@ -228,17 +306,17 @@ class ConfirmEmailChangeSerializer(serializers.Serializer):
         user = request.user
         code = attrs.get("code")
 
-        try:
-            # Find the latest unverified email change request for this user and code
-            req = EmailChangeRequestModel.objects.filter(
-                user=user, code=code, is_verified=False
-            ).latest("created_at")
-        except EmailChangeRequestModel.DoesNotExist:
-            raise serializers.ValidationError("Invalid code!")
+        # Find the latest unverified, unexpired (younger than 1 day) email
+        # change request for this user and code in a single indexed query
+        req = EmailChangeRequestModel.objects.filter(
+            user=user,
+            code=hash_verification_code(code),
+            is_verified=False,
+            created_at__gte=timezone.now() - timedelta(days=1),
+        ).order_by("-created_at").only("id", "new_email").first()
 
-        # Check if the code has expired (older than 1 day)
-        if timezone.now() - req.created_at > timedelta(days=1):
-            raise serializers.ValidationError("This code has expired!")
+        if req is None:
+            raise serializers.ValidationError("Invalid or expired code!")
 
         # Attach the request object to attrs for use in the view
         attrs["email_request"] = req
@@ -257,7 +335,7 @@ class ProfileSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Profile
-        fields = ("first_name", "last_name", "email", "image", "description", "email")
+        fields = ("first_name", "last_name", "email", "image", "description")
 
 
 class PasswordResetRequestSerializer(serializers.Serializer):
@@ -265,9 +343,8 @@ class PasswordResetRequestSerializer(serializers.Serializer):
 
     def validate(self, attrs):
         email = attrs.get("email").lower()
-        try:
-            user = User.objects.get(email=email)
-        except User.DoesNotExist:
+        user = User.objects.only("id", "email").filter(email__lower=email).first()
+        if user is None:
             raise serializers.ValidationError("No user found with this email!")
         attrs["user"] = user
         return attrs
@@ -281,32 +358,25 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
         user = request.user
         code = attrs.get("code")
 
-        try:
-            req = PasswordResetRequest.objects.filter(
-                user=user, code=code, is_verified=False
-            ).latest("created_at")
-        except PasswordResetRequest.DoesNotExist:
-            raise serializers.ValidationError("Invalid code!")
+        # latest unverified code that has not expired (1 day)
+        req = PasswordResetRequest.objects.filter(
+            user=user,
+            code=hash_verification_code(code),
+            is_verified=False,
+            created_at__gte=timezone.now() - timedelta(days=1),
+        ).order_by("-created_at").only("id").first()
 
-        # check expiration (1 day)
-        if timezone.now() - req.created_at > timedelta(days=1):
-            raise serializers.ValidationError("This code has expired!")
+        if req is None:
+            raise serializers.ValidationError("Invalid or expired code!")
 
         attrs["reset_request"] = req
         return attrs
 
 
-class PasswordResetCompleteSerializer(serializers.Serializer):
-    new_password = serializers.CharField(write_only=True, min_length=8)
+class PasswordResetCompleteSerializer(PasswordsMatchMixin, serializers.Serializer):
+    new_password = serializers.CharField(write_only=True)
 
     def validate(self, attrs):
-        password = attrs.get("new_password")
-        try:
-            validate_password(password)
-            return attrs
-        except exceptions.ValidationError as e:
-            # Normalize Django validation errors to DRF format
-            raise serializers.ValidationError(
-                {"password": list(e.messages)}
-            )
+        self._check_password_strength(attrs.get("new_password"))
+        return attrs
 
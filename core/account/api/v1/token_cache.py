@@ -0,0 +1,39 @@
+import secrets
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+def _activation_key(token):
+    return f"activation:{token}"
+
+
+def get_activation_token(user):
+    """
+    Issue a random single-use activation token for the user.
+
+    The token maps to the user's id in the cache and expires after
+    ACTIVATION_TOKEN_LIFETIME.
+    """
+    token = secrets.token_urlsafe(16)
+    cache.set(
+        _activation_key(token),
+        user.pk,
+        timeout=settings.ACTIVATION_TOKEN_LIFETIME.total_seconds(),
+    )
+    return token
+
+
+def get_activation_user_id(token):
+    """
+    Return the user id an activation token was issued for, or None if
+    the token is unknown or expired.
+    """
+    return cache.get(_activation_key(token))
+
+
+def invalidate_activation_token(token):
+    """
+    Drop the activation token once the account is activated.
+    """
+    cache.delete(_activation_key(token))
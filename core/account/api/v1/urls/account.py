@@ -1,5 +1,6 @@
-from django.urls import path
+from django.urls import path, register_converter
 from .. import views
+from ..converters import ActivationTokenConverter
 
 # JWT utilities from Django REST Framework SimpleJWT
 from rest_framework_simplejwt.views import (
@@ -7,6 +8,7 @@ from rest_framework_simplejwt.views import (
     TokenVerifyView,
 )
 
+register_converter(ActivationTokenConverter, "activation_token")
 
 urlpatterns = [
 
@@ -25,7 +27,7 @@ urlpatterns = [
     # -----------------------------
     # Confirms account activation using a unique activation token
     path(
-        "activation/confirm/<str:token>/",
+        "activation/confirm/<activation_token:token>/",
         views.ActivationAPIView.as_view(),
         name="activation",
     ),
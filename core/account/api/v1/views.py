@@ -1,7 +1,6 @@
-import random
-import jwt
-
-from django.conf import settings
+from django.http import Http404
+from django.utils import timezone
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 
 from rest_framework import status, generics
@@ -14,13 +13,13 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView
 
-from jwt import ExpiredSignatureError, InvalidSignatureError
-
-from ...models import User
+from ...models import User, Profile
 from ...tasks import send_registration_email, send_change_email, send_reset_password_email
 from .serializers import *
+from .token_cache import get_activation_token, get_activation_user_id, invalidate_activation_token
 from ...rate_limit import RegistrationRateThrottle, ActivationRateThrottle, LoginRateThrottle, ChangePasswordRateThrottle, ProfileRateThrottle
 from ...models.users import EmailChangeRequestModel, PasswordResetRequest
+from ...utils import generate_verification_code, hash_verification_code
 
 
 class RegistrationAPIView(GenericAPIView):
@@ -41,7 +40,10 @@ class RegistrationAPIView(GenericAPIView):
     def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
 
-        if serializer.is_valid():
+        serializer.is_valid(raise_exception=True)
+
+        # User and profile INSERTs roll back together on any failure
+        with transaction.atomic():
             user_obj = serializer.save()
             email = serializer.validated_data["email"]
 
@@ -56,21 +58,22 @@ class RegistrationAPIView(GenericAPIView):
                     "full_name": full_name,
                 }
 
-                # Generate short-lived JWT activation token
+                # Generate short-lived single-use activation token
                 token = self.get_token_for_user(user_obj)
 
-                # Send activation email asynchronously
-                send_registration_email.apply_async(kwargs={
+                # Send activation email asynchronously once the user row is
+                # committed; broker errors are logged, the user can resend
+                transaction.on_commit(lambda: send_registration_email.apply_async(kwargs={
                     "token": token,
                     "full_name": full_name,
                     "email": email,
-                })
+                }), robust=True)
 
                 return Response(data=data, status=status.HTTP_201_CREATED)
 
             except Exception as e:
                 # Roll back user creation on any downstream failure
-                User.objects.get(email=email).delete()
+                transaction.set_rollback(True)
 
                 # Log error (print is not acceptable for production)
                 print(f"error: {str(e)}")
@@ -80,58 +83,48 @@ class RegistrationAPIView(GenericAPIView):
                     status=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 )
 
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-
     def get_token_for_user(self, user):
         """
-        Generates an access token for account activation.
+        Generates a random token for account activation.
         """
-        refresh = RefreshToken.for_user(user)
-        return str(refresh.access_token)
+        return get_activation_token(user)
 
 
 class ActivationAPIView(APIView):
     """
-    Handles account activation via JWT token.
+    Handles account activation via a random activation token.
     """
 
     throttle_classes = [ActivationRateThrottle]
     permission_classes = [AllowAny]
     def get(self, request, token, *args, **kwargs):
-        try:
-            # Decode activation token using project SECRET_KEY
-            payload = jwt.decode(
-                jwt=token,
-                key=settings.SECRET_KEY,
-                algorithms=["HS256"],
-            )
-            user_id = payload["user_id"]
+        # Resolve the random activation token to its user
+        user_id = get_activation_user_id(token)
 
-        except ExpiredSignatureError:
+        if user_id is None:
             return Response(
-                {"detail": "Token Expired"},
+                {"detail": "Invalid or Expired Token"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        except InvalidSignatureError:
-            return Response(
-                {"detail": "Invalid Token"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+        # Activate in a single conditional UPDATE; only unverified users match
+        activated = User.objects.filter(pk=user_id, is_verified=False).update(
+            is_verified=True, updated_date=timezone.now()
+        )
 
-        # Retrieve user or fail
-        user = get_object_or_404(User, pk=user_id)
+        if not activated:
+            # Either the user does not exist or is already verified
+            if not User.objects.filter(pk=user_id).exists():
+                raise Http404
 
-        # Prevent re-activation
-        if user.is_verified:
+            # Prevent re-activation
             return Response(
                 {"detail": "User already verified"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Activate user account
-        user.is_verified = True
-        user.save()
+        # Activation tokens are single use
+        invalidate_activation_token(token)
 
         return Response(
             {"detail": "Activation Successful."},
@@ -153,7 +146,6 @@ class ActivationResendAPIView(GenericAPIView):
 
         if serializer.is_valid(raise_exception=True):
             user = serializer.validated_data["user"]
-            email = serializer.validated_data["email"]
             full_name = serializer.validated_data["full_name"]
             # Generate new activation token
             token = self.get_token_for_user(user)
@@ -162,7 +154,7 @@ class ActivationResendAPIView(GenericAPIView):
             send_registration_email.apply_async(kwargs={
                 "token": token,
                 "full_name": full_name,
-                "email": email,
+                "email": user.email,
             })
             return Response(
                 {"detail": "email sent successfully."},
@@ -178,8 +170,7 @@ class ActivationResendAPIView(GenericAPIView):
         """
         Generates a fresh activation token.
         """
-        refresh = RefreshToken.for_user(user)
-        return str(refresh.access_token)
+        return get_activation_token(user)
 
 
 class CustomTokenObtainPairView(TokenObtainPairView):
@@ -246,7 +237,7 @@ class ChangePasswordAPIView(generics.GenericAPIView):
 
             # Set and hash new password
             self.object.set_password(serializer.data["new_password"])
-            self.object.save()
+            self.object.save(update_fields=["password", "updated_date"])
 
             return Response(
                 {"detail": "Password Changed Successfully"},
@@ -275,14 +266,18 @@ class ChangeEmailAPIView(generics.GenericAPIView):
         serializer = self.serializer_class(data=request.data, context={"request": request})
         if serializer.is_valid():
             new_email = serializer.validated_data["new_email"]
-            code = str(random.randint(100000, 999999))
+            code = generate_verification_code()
 
-            EmailChangeRequestModel.objects.create(user=request.user, new_email=new_email, code=code)
+            with transaction.atomic():
+                EmailChangeRequestModel.objects.create(
+                    user=request.user, new_email=new_email, code=hash_verification_code(code)
+                )
 
-            send_change_email.apply_async(kwargs={
-                "code": code,
-                "new_email": new_email,
-            })
+                # Dispatch only after the request row is committed
+                transaction.on_commit(lambda: send_change_email.apply_async(kwargs={
+                    "code": code,
+                    "new_email": new_email,
+                }))
 
             return Response({"detail": "Email sent successfully."}, status=status.HTTP_201_CREATED)
 
@@ -309,12 +304,14 @@ class ConfirmEmailChangeAPIView(generics.GenericAPIView):
         if serializer.is_valid():
             req = serializer.validated_data["email_request"]
 
-            req.is_verified = True
-            req.save()
+            # Mark the request used and switch the email together
+            with transaction.atomic():
+                req.is_verified = True
+                req.save(update_fields=["is_verified"])
 
-            user = request.user
-            user.email = req.new_email
-            user.save()
+                user = request.user
+                user.email = req.new_email
+                user.save(update_fields=["email", "updated_date"])
 
             return Response({"detail": "Email successfully changed."}, status=status.HTTP_200_OK)
 
@@ -334,11 +331,25 @@ class ProfileRetrieveUpdateAPIView(generics.RetrieveUpdateAPIView):
     parser_classes = [MultiPartParser, FormParser]
     throttle_classes = [ProfileRateThrottle]
 
+    def get_queryset(self):
+        """
+        Return profiles with the user's email joined and only the
+        columns the serializer reads (plus updated_at so saves bump it).
+        """
+        return Profile.objects.select_related("user").only(
+            "first_name",
+            "last_name",
+            "image",
+            "description",
+            "updated_at",
+            "user__email",
+        )
+
     def get_object(self):
         """
         Return the profile object of the currently authenticated user.
         """
-        return self.request.user.profile
+        return get_object_or_404(self.get_queryset(), user=self.request.user)
 
 
 class PasswordResetRequestAPIView(generics.GenericAPIView):
@@ -349,8 +360,8 @@ class PasswordResetRequestAPIView(generics.GenericAPIView):
         serializer = self.serializer_class(data=request.data)
         if serializer.is_valid():
             user = serializer.validated_data["user"]
-            code = str(random.randint(100000, 999999))
-            PasswordResetRequest.objects.create(user=user, code=code)
+            code = generate_verification_code()
+            PasswordResetRequest.objects.create(user=user, code=hash_verification_code(code))
 
             # send email asynchronously
             send_reset_password_email.apply_async(kwargs={
@@ -372,7 +383,7 @@ class PasswordResetConfirmAPIView(generics.GenericAPIView):
         if serializer.is_valid():
             req = serializer.validated_data["reset_request"]
             req.is_verified = True
-            req.save()
+            req.save(update_fields=["is_verified"])
             return Response({"detail": "Code verified successfully."}, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -390,7 +401,7 @@ class PasswordResetCompleteAPIView(generics.GenericAPIView):
             user = request.user
             # Use Django's built-in method to set password safely
             user.set_password(new_password)
-            user.save()
+            user.save(update_fields=["password", "updated_date"])
 
             return Response({"detail": "Password changed successfully."}, status=status.HTTP_200_OK)
 
@@ -0,0 +1,37 @@
+from django.contrib.auth.backends import ModelBackend
+
+from .models import User
+
+
+class EmailBackend(ModelBackend):
+    """
+    Authentication backend that loads only the columns needed to
+    verify credentials instead of the full User row.
+    """
+
+    # Columns read while checking credentials and issuing tokens
+    auth_fields = ("id", "email", "password", "is_active", "is_staff", "is_verified")
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        """
+        Authenticate a user by email and password.
+        """
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+
+        try:
+            # Case-insensitive, served by the user_email_ci_unique index
+            user = User.objects.only(*self.auth_fields).get(
+                email__lower=username.lower()
+            )
+        except User.DoesNotExist:
+            # Run the default password hasher once to reduce the timing
+            # difference between an existing and a nonexistent user
+            User().set_password(password)
+            return None
+
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
@@ -0,0 +1,54 @@
+# Generated by Django 5.2 on 2026-10-15 00:46
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+def check_case_insensitive_duplicates(apps, schema_editor):
+    """
+    Fails before the constraint is added if existing emails differ only
+    by letter case; those accounts must be merged or renamed first.
+    """
+    User = apps.get_model("account", "User")
+    users = User.objects.using(schema_editor.connection.alias)
+
+    duplicates = (
+        users.annotate(email_lower=django.db.models.functions.text.Lower("email"))
+        .values("email_lower")
+        .annotate(total=models.Count("id"))
+        .filter(total__gt=1)
+        .values_list("email_lower", flat=True)
+    )
+    conflicting = sorted(
+        users.annotate(email_lower=django.db.models.functions.text.Lower("email"))
+        .filter(email_lower__in=list(duplicates))
+        .values_list("email", flat=True)
+    )
+
+    if conflicting:
+        raise RuntimeError(
+            "Cannot add user_email_ci_unique: these emails differ only by "
+            "letter case; merge or rename those accounts, then migrate again: "
+            + ", ".join(conflicting)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0001_initial"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            check_case_insensitive_duplicates, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("email"),
+                name="user_email_ci_unique",
+            ),
+        ),
+    ]
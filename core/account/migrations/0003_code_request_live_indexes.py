@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-15 00:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0002_user_email_ci_unique"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="emailchangerequestmodel",
+            index=models.Index(
+                condition=models.Q(("is_verified", False)),
+                fields=["user", "code", "-created_at"],
+                name="ecr_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="passwordresetrequest",
+            index=models.Index(
+                condition=models.Q(("is_verified", False)),
+                fields=["user", "code", "-created_at"],
+                name="prr_live_idx",
+            ),
+        ),
+    ]
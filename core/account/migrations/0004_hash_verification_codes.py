@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-15 00:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0003_code_request_live_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="emailchangerequestmodel",
+            name="code",
+            field=models.CharField(max_length=64),
+        ),
+        migrations.AlterField(
+            model_name="passwordresetrequest",
+            name="code",
+            field=models.CharField(max_length=64),
+        ),
+    ]
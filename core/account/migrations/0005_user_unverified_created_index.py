@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-15 00:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0004_hash_verification_codes"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                condition=models.Q(("is_verified", False)),
+                fields=["created_date"],
+                name="user_unverified_created_idx",
+            ),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import (
     AbstractBaseUser,
     BaseUserManager,
@@ -13,9 +14,12 @@ class UserManager(BaseUserManager):
     instead of username.
     """
 
-    def create_user(self, email, password=None, **extra_fields):
+    def create_user(self, email, password=None, profile_data=None, **extra_fields):
         """
         Create and return a regular user with an email and password.
+
+        `profile_data` (Profile field values, e.g. first/last name) is
+        handed to the post_save signal so the Profile is inserted populated.
         """
         if not email:
             raise ValueError(_("Users must have an email address"))
@@ -23,6 +27,8 @@ class UserManager(BaseUserManager):
         email = self.normalize_email(email)
         user = self.model(email=email, **extra_fields)
         user.set_password(password)
+        if profile_data:
+            user._profile_data = profile_data
         user.save(using=self._db)
         return user
 
@@ -83,6 +89,21 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     objects = UserManager()
 
+    class Meta:
+        constraints = [
+            # Emails are unique regardless of letter case
+            models.UniqueConstraint(Lower("email"), name="user_email_ci_unique"),
+        ]
+        indexes = [
+            # Serves the nightly unverified-user cleanup; verified users
+            # (the vast majority) are left out of the index
+            models.Index(
+                fields=["created_date"],
+                name="user_unverified_created_idx",
+                condition=models.Q(is_verified=False),
+            ),
+        ]
+
     def __str__(self):
         """
         Return the string representation of the user.
@@ -90,6 +111,12 @@ class User(AbstractBaseUser, PermissionsMixin):
         return self.email
 
 
+# Allow `email__lower=...` lookups, which compile to LOWER("email") = ... and
+# are served by the user_email_ci_unique index (iexact compiles to UPPER()
+# on PostgreSQL and cannot use it)
+User._meta.get_field("email").register_lookup(Lower)
+
+
 class EmailChangeRequestModel(models.Model):
     """
     Model to store pending email change requests.
@@ -104,7 +131,7 @@ class EmailChangeRequestModel(models.Model):
     Fields:
         user (ForeignKey): Reference to the user requesting the email change.
         new_email (EmailField): The new email address to be verified.
-        code (CharField): 6-digit OTP code sent to the new email.
+        code (CharField): Keyed hash of the 6-digit OTP code sent to the new email.
         created_at (DateTimeField): Timestamp when the request was created.
         is_verified (BooleanField): Flag indicating whether the request has been confirmed.
     """
@@ -115,8 +142,8 @@ class EmailChangeRequestModel(models.Model):
     # The new email address that needs to be verified
     new_email = models.EmailField()
 
-    # One-time password (OTP) code for verification
-    code = models.CharField(max_length=6)
+    # Keyed hash of the one-time password (OTP) code for verification
+    code = models.CharField(max_length=64)
 
     # Timestamp when the request was created (auto set)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -124,6 +151,17 @@ class EmailChangeRequestModel(models.Model):
     # Whether the request has been verified successfully
     is_verified = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            # Serves the "latest unverified code for this user" lookup;
+            # only live (unverified) rows are kept in the index
+            models.Index(
+                fields=["user", "code", "-created_at"],
+                name="ecr_live_idx",
+                condition=models.Q(is_verified=False),
+            ),
+        ]
+
     def __str__(self):
         """
         String representation of the model.
@@ -133,9 +171,18 @@ class EmailChangeRequestModel(models.Model):
 
 class PasswordResetRequest(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
-    code = models.CharField(max_length=6)  # OTP code
+    code = models.CharField(max_length=64)  # keyed hash of the OTP code
     created_at = models.DateTimeField(auto_now_add=True)
     is_verified = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["user", "code", "-created_at"],
+                name="prr_live_idx",
+                condition=models.Q(is_verified=False),
+            ),
+        ]
+
     def __str__(self):
         return f"{self.user.email} - verified: {self.is_verified}"
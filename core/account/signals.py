@@ -8,8 +8,16 @@ def save_profile(sender, instance, created, **kwargs):
     """
     Signal handler to automatically create a Profile instance
     whenever a new User instance is created.
+
+    Contract: when the new user carries a `_profile_data` dict of Profile
+    field values, the profile is inserted with them. UserManager.create_user
+    sets it from its `profile_data` argument; users saved without it
+    (the admin, createsuperuser, a bare User.save()) get a profile with
+    empty names.
     """
 
     if created:
         # Create a profile linked to the newly created user
-        Profile.objects.create(user=instance)
+        Profile.objects.create(
+            user=instance, **getattr(instance, "_profile_data", {})
+        )
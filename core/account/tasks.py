@@ -1,4 +1,4 @@
-from .models import User
+from .models import User, EmailChangeRequestModel, PasswordResetRequest
 from celery import shared_task
 from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
@@ -6,6 +6,8 @@ from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
 
+from core.mail import send_email
+
 
 @shared_task
 def send_registration_email(token, full_name, email):
@@ -46,7 +48,7 @@ def send_registration_email(token, full_name, email):
     email_obj.attach_alternative(html_content, "text/html")
 
     # Send the email
-    email_obj.send()
+    send_email(email_obj)
 
 
 @shared_task
@@ -86,7 +88,7 @@ def send_change_email(code, new_email):
     email_obj.attach_alternative(html_content, "text/html")
 
     # Send the email
-    email_obj.send()
+    send_email(email_obj)
 
 
 @shared_task
@@ -115,25 +117,46 @@ def send_reset_password_email(code, email):
     email_obj.attach_alternative(html_content, "text/html")
 
     # Send the email
-    email_obj.send()
+    send_email(email_obj)
 
 
 @shared_task
-def delete_unverified_users():
+def delete_unverified_users(batch_size=10000):
     """
     Celery task to delete unverified users older than 1 day.
 
     Process:
         - Calculate cutoff time (current time minus 1 day).
-        - Find all users who are not verified and created before cutoff.
-        - Delete those users from the database.
+        - Delete users who are not verified and created before cutoff in
+          batches of `batch_size`, so each DELETE (and its cascades) holds
+          locks only briefly and ids are never all loaded at once.
     """
     # Calculate cutoff time (1 day ago)
     cutoff = timezone.now() - timedelta(days=1)
 
-    # Query unverified users older than cutoff
-    users = User.objects.filter(is_verified=False, created_at__lt=cutoff)
+    expired = User.objects.filter(is_verified=False, created_date__lt=cutoff)
+
+    while True:
+        batch = list(expired.values_list("pk", flat=True)[:batch_size])
+        if not batch:
+            break
+        User.objects.filter(pk__in=batch).delete()
+
+
+@shared_task
+def delete_expired_code_requests():
+    """
+    Celery task to delete email change and password reset requests
+    older than 1 day.
+
+    Process:
+        - Calculate cutoff time (current time minus 1 day).
+        - Delete all requests created before cutoff; their codes are
+          already rejected as expired, so this only keeps the tables
+          (and their partial indexes) small.
+    """
+    # Calculate cutoff time (1 day ago)
+    cutoff = timezone.now() - timedelta(days=1)
 
-    # Delete each unverified user
-    for user in users:
-        user.delete()
\ No newline at end of file
+    EmailChangeRequestModel.objects.filter(created_at__lt=cutoff).delete()
+    PasswordResetRequest.objects.filter(created_at__lt=cutoff).delete()
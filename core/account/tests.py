@@ -1,3 +1,294 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import NoReverseMatch, reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from .api.v1.token_cache import get_activation_user_id
+from .models import User
+from .models.users import EmailChangeRequestModel, PasswordResetRequest
+from .tasks import send_change_email, send_registration_email, send_reset_password_email
+from .utils import hash_verification_code
+
+
+class RegistrationValidationTests(TestCase):
+    """
+    Input validation of the registration endpoint.
+    """
+
+    url = reverse("account:api-v1:registration")
+
+    def setUp(self):
+        # Registration is throttled per client through the cache
+        cache.clear()
+        self.client = APIClient()
+
+    def payload(self, **overrides):
+        data = {
+            "first_name": "Ali",
+            "last_name": "Bargh",
+            "email": "ali@example.com",
+            "password": "Str0ng-Passw0rd!",
+            "password2": "Str0ng-Passw0rd!",
+        }
+        data.update(overrides)
+        return data
+
+    def test_non_object_body_is_rejected(self):
+        response = self.client.post(self.url, [self.payload()], format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("non_field_errors", response.data)
+        self.assertFalse(User.objects.exists())
+
+    def test_email_taken_in_another_case_is_rejected(self):
+        User.objects.create_user(email="Ali@Example.COM", password="x")
+
+        response = self.client.post(
+            self.url, self.payload(email="ali@example.com"), format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("email", response.data)
+        self.assertEqual(User.objects.count(), 1)
+
+    def test_blank_fields_are_rejected(self):
+        blank = dict.fromkeys(self.payload(), "")
+
+        response = self.client.post(self.url, blank, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.data), set(blank))
+        self.assertFalse(User.objects.exists())
+
+
+class ActivationTokenTests(TestCase):
+    """
+    Cache-backed single-use activation tokens.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def register(self):
+        """
+        Registers a user and returns the activation token that was mailed.
+        """
+        payload = {
+            "first_name": "Ali",
+            "last_name": "Bargh",
+            "email": "ali@example.com",
+            "password": "Str0ng-Passw0rd!",
+            "password2": "Str0ng-Passw0rd!",
+        }
+        with mock.patch.object(send_registration_email, "apply_async") as send:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    reverse("account:api-v1:registration"), payload, format="json"
+                )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return send.call_args.kwargs["kwargs"]["token"]
+
+    def activation_url(self, token):
+        return reverse("account:api-v1:activation", kwargs={"token": token})
+
+    def test_token_activates_once(self):
+        token = self.register()
+
+        response = self.client.get(self.activation_url(token))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(User.objects.get(email="ali@example.com").is_verified)
+        self.assertIsNone(get_activation_user_id(token))
+
+        response = self.client.get(self.activation_url(token))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["detail"], "Invalid or Expired Token")
+
+    @override_settings(ACTIVATION_TOKEN_LIFETIME=timedelta(0))
+    def test_expired_token_is_rejected(self):
+        token = self.register()
+
+        response = self.client.get(self.activation_url(token))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(User.objects.get(email="ali@example.com").is_verified)
+
+    def test_unknown_token_is_rejected(self):
+        response = self.client.get(self.activation_url("A" * 22))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_malformed_token_does_not_resolve(self):
+        valid = self.activation_url("A" * 22)
+
+        for token in ("A" * 21, "A" * 23, "A" * 21 + "."):
+            with self.subTest(token=token):
+                with self.assertRaises(NoReverseMatch):
+                    self.activation_url(token)
+
+                response = self.client.get(valid.replace("A" * 22, token))
+
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_resend_mails_the_stored_address(self):
+        User.objects.create_user(email="ali@example.com", password="x")
+
+        with mock.patch.object(send_registration_email, "apply_async") as send:
+            response = self.client.post(
+                reverse("account:api-v1:activation-resend"),
+                {"email": "ALI@example.com"},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(send.call_args.kwargs["kwargs"]["email"], "ali@example.com")
+
+
+class EmailLoginTests(TestCase):
+    """
+    JWT login through EmailBackend.
+    """
+
+    url = reverse("account:api-v1:jwt_create")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="Ali@example.com", password="Str0ng-Passw0rd!"
+        )
+
+    def login(self, email, password="Str0ng-Passw0rd!"):
+        return self.client.post(
+            self.url, {"email": email, "password": password}, format="json"
+        )
+
+    def test_email_is_matched_case_insensitively(self):
+        response = self.login("ali@EXAMPLE.com")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["user_id"], self.user.id)
+        self.assertEqual(response.data["user_email"], "Ali@example.com")
+        self.assertIn("access", response.data)
+
+    def test_wrong_password_is_rejected(self):
+        response = self.login("ali@example.com", password="wrong")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_unknown_email_is_rejected(self):
+        response = self.login("nobody@example.com")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_inactive_user_is_rejected(self):
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.login("Ali@example.com")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(
+        AUTHENTICATION_BACKENDS=["django.contrib.auth.backends.ModelBackend"]
+    )
+    def test_other_backends_go_through_authenticate(self):
+        response = self.login("Ali@example.com")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["user_id"], self.user.id)
+        self.assertEqual(response.data["user_email"], "Ali@example.com")
+
+
+class VerificationCodeTests(TestCase):
+    """
+    One-time codes for email change and password reset, stored hashed.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email="ali@example.com", password="x")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def request_email_change(self):
+        """
+        Requests an email change and returns the code that was mailed.
+        """
+        with mock.patch.object(send_change_email, "apply_async") as send:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.put(
+                    reverse("account:api-v1:change_email"),
+                    {"old_email": "ali@example.com", "new_email": "new@example.com"},
+                    format="json",
+                )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return send.call_args.kwargs["kwargs"]["code"]
+
+    def confirm_email_change(self, code):
+        return self.client.post(
+            reverse("account:api-v1:confirm-change-email"), {"code": code}, format="json"
+        )
+
+    def test_codes_are_stored_hashed(self):
+        code = self.request_email_change()
+
+        with mock.patch.object(send_reset_password_email, "apply_async") as send:
+            self.client.post(
+                reverse("account:api-v1:password-reset-request"),
+                {"email": "ali@example.com"},
+                format="json",
+            )
+        reset_code = send.call_args.kwargs["kwargs"]["code"]
+
+        stored = EmailChangeRequestModel.objects.get().code
+        self.assertNotEqual(stored, code)
+        self.assertEqual(stored, hash_verification_code(code))
+
+        stored = PasswordResetRequest.objects.get().code
+        self.assertNotEqual(stored, reset_code)
+        self.assertEqual(stored, hash_verification_code(reset_code))
+
+    def test_code_changes_email_once(self):
+        code = self.request_email_change()
+
+        response = self.confirm_email_change(code)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.email, "new@example.com")
+
+        response = self.confirm_email_change(code)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_wrong_code_is_rejected(self):
+        code = self.request_email_change()
+        wrong = "100000" if code != "100000" else "100001"
+
+        response = self.confirm_email_change(wrong)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.email, "ali@example.com")
+
+    def test_expired_code_is_rejected(self):
+        code = self.request_email_change()
+        EmailChangeRequestModel.objects.update(
+            created_at=timezone.now() - timedelta(days=1, seconds=1)
+        )
+
+        response = self.confirm_email_change(code)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.email, "ali@example.com")
@@ -1,3 +1,20 @@
+import secrets
+
+from django.utils.crypto import salted_hmac
+
+
 # making a path for profiles images
 def profile_image_path(instans, file_name):
-    return f"profile/{instans.user.id}/{file_name}"
\ No newline at end of file
+    return f"profile/{instans.user.id}/{file_name}"
+
+
+# making a 6-digit one-time verification code (email change / password reset)
+def generate_verification_code():
+    return f"{secrets.randbelow(900_000) + 100_000:06d}"
+
+
+# verification codes are stored as a keyed hash, never in plain text
+def hash_verification_code(code):
+    return salted_hmac(
+        "account.verification_code", code, algorithm="sha256"
+    ).hexdigest()
@@ -14,4 +14,8 @@ app.conf.beat_schedule = {
         'task': 'account.tasks.delete_unverified_users',
         'schedule': crontab(hour=0, minute=0),  # every night at 00:00
     },
+    'delete-expired-code-requests-daily': {
+        'task': 'account.tasks.delete_expired_code_requests',
+        'schedule': crontab(hour=0, minute=30),  # every night at 00:30
+    },
 }
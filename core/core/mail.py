@@ -0,0 +1,38 @@
+import smtplib
+
+from celery.signals import worker_process_shutdown
+from django.core.mail import get_connection
+
+
+# SMTP connection kept open per worker process and shared by every email
+# task, so consecutive emails skip the TCP/TLS handshake
+_connection = None
+
+
+def send_email(email_obj):
+    """
+    Send an email over the worker's shared SMTP connection.
+
+    The connection is (re)opened lazily; if the server has dropped it
+    while idle, it is reopened once and the send retried.
+    """
+    global _connection
+    if _connection is None:
+        _connection = get_connection()
+
+    # No-op when the connection is already open
+    _connection.open()
+    email_obj.connection = _connection
+
+    try:
+        email_obj.send()
+    except smtplib.SMTPServerDisconnected:
+        _connection.close()
+        _connection.open()
+        email_obj.send()
+
+
+@worker_process_shutdown.connect
+def _close_connection(**kwargs):
+    if _connection is not None:
+        _connection.close()
@@ -136,6 +136,13 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # -----------------------------------------
 AUTH_USER_MODEL = "account.User"
 
+# -----------------------------------------
+# Authentication backends
+# -----------------------------------------
+AUTHENTICATION_BACKENDS = [
+    "account.backends.EmailBackend",
+]
+
 
 # -----------------------------------------
 # Sending email settings
@@ -203,6 +210,23 @@ SIMPLE_JWT = {
     'BLACKLIST_AFTER_ROTATION': True,           
 }
 
+# Lifetime of the random single-use account activation tokens
+ACTIVATION_TOKEN_LIFETIME = timedelta(minutes=15)
+
+# Lifetime of the signed project invitation tokens
+INVITATION_TOKEN_LIFETIME = timedelta(minutes=15)
+
+# -----------------------------------------
+# Cache settings
+# -----------------------------------------
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("REDIS_CACHE_URL", "redis://localhost:6379/2"),
+    }
+}
+
 # -----------------------------------------
 # Celery settings
 # -----------------------------------------
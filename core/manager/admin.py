@@ -1,9 +1,33 @@
 from django.contrib import admin
 from .models import *
 # Register your models here.
-admin.site.register(Project)
 
 
-admin.site.register(ProjectMember)
+@admin.register(Project)
+class ProjectAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the Project model.
+    """
 
-admin.site.register(ProjectInvitation)
\ No newline at end of file
+    # __str__ reads the owner's name; join it instead of querying per row
+    list_select_related = ("owner",)
+
+
+@admin.register(ProjectMember)
+class ProjectMemberAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the ProjectMember model.
+    """
+
+    # __str__ reads the member's email and the project's owner name
+    list_select_related = ("user__user", "project__owner")
+
+
+@admin.register(ProjectInvitation)
+class ProjectInvitationAdmin(admin.ModelAdmin):
+    """
+    Admin configuration for the ProjectInvitation model.
+    """
+
+    # __str__ reads the invitee's email and the project's owner name
+    list_select_related = ("invitee__user", "project__owner")
@@ -9,24 +9,21 @@ class IsOwnerOrAdminMember(BasePermission):
     - An admin/owner member of the project.
 
     Rules:
-    - For GET requests: user must be either the owner or a member of the project.
-    - For other requests (update/delete): user must be the owner or have role OWNER/ADMIN.
+    - Every request (read, update, delete): user must be the owner or
+      have role OWNER/ADMIN in the project.
     """
 
     def has_object_permission(self, request, view, obj):
         # Get the current user's profile
         profile = request.user.profile
 
-        # For GET requests: allow if user is project owner or a member
-        if request.method == "get":
-            return obj.members.filter(user=profile).exists() or obj.owner == profile
-
-        # Allow if user is the project owner
-        if obj.owner == profile:
+        # Project owner is always allowed (compares ids, no owner fetch)
+        if obj.owner_id == profile.id:
             return True
 
-        # Allow if user is a member with OWNER or ADMIN role
-        return obj.members.filter(
+        # Otherwise an OWNER or ADMIN membership is required
+        return ProjectMember.objects.filter(
+            project=obj,
             user=profile,
-            role__in=[ProjectMember.Role.OWNER, ProjectMember.Role.ADMIN]
-        ).exists()
\ No newline at end of file
+            role__in=[ProjectMember.Role.OWNER, ProjectMember.Role.ADMIN],
+        ).exists()
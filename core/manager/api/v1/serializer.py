@@ -1,7 +1,10 @@
 from rest_framework import serializers
 from manager.models import Project, ProjectMember, Task, ProjectInvitation
 from account.models import Profile
-from django.shortcuts import get_object_or_404
+from django.http import Http404
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils.functional import cached_property
 
 
 class TaskSerializer(serializers.ModelSerializer):
@@ -23,25 +26,17 @@ class TaskSerializer(serializers.ModelSerializer):
 
 class ProjectsSerializer(serializers.ModelSerializer):
     """
-    Serializer for the Project model.
+    Base serializer for the Project model.
 
-    - Includes project owner information via `get_owner`.
-    - Serializes related tasks using `TaskSerializer`.
-    - Provides additional fields: `min_description`, `absolute_url`, and `role`.
-    - Customizes representation depending on whether a project detail view or list view is requested.
+    - Includes the project owner's email.
+    - Provides the `role` of the current user in the project.
+    - Assigns the current user as owner on create.
+    - List and detail endpoints use the subclasses below, which only
+      declare (and compute) the fields they return.
     """
 
-    # Custom field to return project owner's email
-    owner = serializers.SerializerMethodField(method_name="get_owner")
-
-    # Nested serializer for related tasks
-    tasks = TaskSerializer(many=True, read_only=True)
-
-    # Read-only field for shortened description
-    min_description = serializers.ReadOnlyField()
-
-    # Custom field to return absolute URL of the project
-    absolute_url = serializers.SerializerMethodField(method_name="get_absolute_url")
+    # Project owner's email, read through the joined owner -> user rows
+    owner = serializers.CharField(source="owner.user.email", read_only=True)
 
     # Custom field to return the role of the current user in the project
     role = serializers.SerializerMethodField(method_name="get_role")
@@ -49,38 +44,21 @@ class ProjectsSerializer(serializers.ModelSerializer):
     class Meta:
         model = Project
         fields = (
-            'id', 'owner', 'name', 'role', 'description',
-            'min_description', 'created', 'updated',
-            'status', 'absolute_url', 'tasks'
+            'id', 'owner', 'name', 'role',
+            'created', 'updated', 'status'
         )
         read_only_fields = ["id", "owner", "created", "updated"]
 
-    def to_representation(self, instance):
+    @cached_property
+    def current_profile(self):
         """
-        Customize the serialized representation of the project.
+        Profile of the requesting user, resolved once per serializer.
 
-        - If a specific project (`pk`) is requested:
-            * Remove `absolute_url` and `min_description`.
-        - If listing projects:
-            * Remove `description` and `tasks` for brevity.
+        List serializers share one child instance across all rows, so
+        this is evaluated once per request. None for anonymous users.
         """
-        request = self.context.get('request')
-        rep = super().to_representation(instance)
-
-        if request.parser_context.get("kwargs").get("pk"):
-            # Detail view: remove URL and min_description
-            rep.pop("absolute_url")
-            rep.pop("min_description")
-        else:
-            # List view: remove description and tasks
-            rep.pop("description")
-            rep.pop("tasks")
-
-        return rep
-
-    def get_owner(self, obj):
-        """Return the email of the project owner."""
-        return obj.owner.user.email
+        user = self.context['request'].user
+        return user.profile if user.is_authenticated else None
 
     def get_role(self, obj):
         """
@@ -90,32 +68,81 @@ class ProjectsSerializer(serializers.ModelSerializer):
         - If the user is a member → return their role.
         - Otherwise → None.
         """
-        profile = self.context['request'].user.profile
+        profile = self.current_profile
+
+        # Anonymous visitors (public endpoints) have no role
+        if profile is None:
+            return None
 
         # If the person is the project owner
         if obj.owner_id == profile.id:
             return 'owner'
 
-        # If the person is a member
-        membership = getattr(obj, 'current_user_membership', None)
-        if membership:
-            return membership[0].role
-
-        return None
-
-    def get_absolute_url(self, obj):
-        """Return the absolute URL for the project instance."""
-        request = self.context.get("request")
-        return request.build_absolute_uri(obj.pk)
+        # If the person is a member; every view serving these serializers
+        # annotates the role for authenticated users
+        return obj.current_user_role
 
     def create(self, validated_data):
         """
         Create a new project with the current user as the owner.
         """
-        validated_data['owner'] = self.context['request'].user.profile
+        validated_data['owner'] = self.current_profile
         return super().create(validated_data)
 
 
+class ProjectListSerializer(ProjectsSerializer):
+    """
+    Serializer for project list endpoints.
+
+    - Adds `min_description` and `absolute_url`.
+    - Leaves out `description` and `tasks` for brevity.
+    """
+
+    # Shortened description, annotated by the list views
+    min_description = serializers.CharField(source='min_description_text', read_only=True)
+
+    # Custom field to return absolute URL of the project
+    absolute_url = serializers.SerializerMethodField(method_name="get_absolute_url")
+
+    class Meta(ProjectsSerializer.Meta):
+        fields = (
+            'id', 'owner', 'name', 'role',
+            'min_description', 'created', 'updated',
+            'status', 'absolute_url'
+        )
+
+    @cached_property
+    def base_uri(self):
+        """
+        Absolute URI of the current list endpoint, built once per request
+        (list serializers share one child instance across all rows).
+        """
+        request = self.context.get("request")
+        return request.build_absolute_uri(request.path)
+
+    def get_absolute_url(self, obj):
+        """Return the absolute URL for the project instance."""
+        return f"{self.base_uri}{obj.pk}"
+
+
+class ProjectDetailSerializer(ProjectsSerializer):
+    """
+    Serializer for a single project.
+
+    - Adds the full `description`.
+    - Serializes related tasks using `TaskSerializer`.
+    """
+
+    # Nested serializer for related tasks
+    tasks = TaskSerializer(many=True, read_only=True)
+
+    class Meta(ProjectsSerializer.Meta):
+        fields = (
+            'id', 'owner', 'name', 'role', 'description',
+            'created', 'updated', 'status', 'tasks'
+        )
+
+
 class CreateProjectSerializer(serializers.ModelSerializer):
     """
     Serializer for creating a new project.
@@ -138,18 +165,22 @@ class CreateProjectSerializer(serializers.ModelSerializer):
 
         - Sets the owner field to the authenticated user's profile.
         - Creates a corresponding `ProjectMember` record with role 'owner'.
+        - Both rows are inserted in one transaction, so a project never
+          exists without its owner membership.
         """
-        validated_data['owner'] = self.context.get('request').user.profile
+        profile = self.context.get('request').user.profile
+        validated_data['owner'] = profile
 
-        # Create project instance
-        project = super().create(validated_data)
+        with transaction.atomic():
+            # Create project instance
+            project = super().create(validated_data)
 
-        # Create project membership for the owner
-        ProjectMember.objects.create(
-            project=project,
-            role='owner',
-            user=self.context.get('request').user.profile
-        )
+            # Create project membership for the owner
+            ProjectMember.objects.create(
+                project=project,
+                role='owner',
+                user=profile
+            )
 
         return project
 
@@ -178,53 +209,69 @@ class ProjectInvitationSerializer(serializers.ModelSerializer):
         - Ensure the provided email belongs to an existing user.
         - Ensure the user is not already a member of the project.
         - Ensure there is no active pending invitation for the user.
+        - Ensure the invitation does not grant the owner role.
         """
-        # Check if user with given email exists
-        if not Profile.objects.filter(user__email=attrs['email']).exists():
-            raise serializers.ValidationError({"detail": "No user with this email exists."})
+        # Ownership is not transferable by invitation; a project has
+        # exactly one owner membership
+        if attrs.get("role") == ProjectMember.Role.OWNER:
+            raise serializers.ValidationError({"role": "A project can only have one owner."})
 
         # Get project from request context
         request = self.context["request"]
         project_id = request.parser_context["kwargs"]["pk"]
-        project = get_object_or_404(Project, pk=project_id)
 
-        # Get invitee profile
-        invitee = Profile.objects.get(user__email=attrs["email"])
+        # Fetch invitee profile together with the project's existence and
+        # the membership / pending-invitation status in one query
+        invitee = Profile.objects.filter(
+            user__email__lower=attrs["email"].lower()
+        ).select_related("user").annotate(
+            project_exists=Exists(Project.objects.filter(pk=project_id)),
+            is_member=Exists(
+                ProjectMember.objects.filter(project_id=project_id, user=OuterRef("pk"))
+            ),
+            has_pending_invitation=Exists(
+                ProjectInvitation.objects.filter(
+                    project_id=project_id,
+                    invitee=OuterRef("pk"),
+                    status=ProjectInvitation.Status.PENDING,
+                )
+            ),
+        ).first()
+
+        # Check if user with given email exists
+        if invitee is None:
+            raise serializers.ValidationError({"detail": "No user with this email exists."})
+
+        if not invitee.project_exists:
+            raise Http404
 
         # Check if invitee is already a member of the project
-        if ProjectMember.objects.filter(project=project, user=invitee).exists():
+        if invitee.is_member:
             raise serializers.ValidationError({"detail": "The user is a member of the project"})
 
         # Check if there is already a pending invitation for this user
-        if ProjectInvitation.objects.filter(
-                project=project,
-                invitee=invitee,
-                status=ProjectInvitation.Status.PENDING
-        ).exists():
+        if invitee.has_pending_invitation:
             raise serializers.ValidationError({"detail": "There is an active invitation for this user."})
 
+        # Reused by create() and the view instead of fetching them again
+        attrs["invitee"] = invitee
+        attrs["project_id"] = project_id
+
         return attrs
 
     def create(self, validated_data):
         """
         Create a new project invitation.
 
-        - Retrieves the project from request context.
-        - Finds the invitee profile using the provided email.
+        - Uses the project id and invitee profile resolved during validation.
         - Creates a ProjectInvitation with the specified role and inviter.
         """
         request = self.context["request"]
 
-        # Get project from request context
-        project = Project.objects.get(pk=request.parser_context["kwargs"]["pk"])
-
-        # Get invitee profile from email
-        invitee = Profile.objects.get(user__email=validated_data.pop("email"))
-
         # Create invitation record
         invitation = ProjectInvitation.objects.create(
-            project=project,
-            invitee=invitee,
+            project_id=validated_data["project_id"],
+            invitee=validated_data["invitee"],
             role=validated_data["role"],
             invited_by=request.user.profile
         )
@@ -1,33 +1,100 @@
 from rest_framework import generics, status
-from manager.api.v1.serializer import ProjectsSerializer, CreateProjectSerializer, ProjectInvitationSerializer
-from ...models import Project, ProjectMember, ProjectInvitation
-from account.models import Profile
+from manager.api.v1.serializer import (
+    ProjectListSerializer,
+    ProjectDetailSerializer,
+    CreateProjectSerializer,
+    ProjectInvitationSerializer,
+)
+from ...models import Project, ProjectMember, ProjectInvitation, Task
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from manager.api.v1.paginations import DefaultPagination
-from django.db.models import Q, Prefetch            
+from django.db.models import Q, Prefetch, OuterRef, Subquery
+from django.db.models.functions import Substr
 from .permissions import IsOwnerOrAdminMember
-from django.shortcuts import get_object_or_404
+from django.db import transaction
 from ...tasks import send_registration_email
-from rest_framework_simplejwt.tokens import RefreshToken
 import jwt
 from django.conf import settings
+from django.utils import timezone
 from jwt import ExpiredSignatureError, InvalidSignatureError
 
 
-class PublicProjectsAPIView(generics.ListAPIView):
+# Columns ProjectListSerializer renders; min_description is computed in SQL
+# (same 6 characters as Project.min_description) so the full description
+# is never loaded for lists
+LIST_FIELDS = (
+    'id', 'name', 'status', 'created', 'updated',
+    'owner_id', 'owner__user__email',
+)
+MIN_DESCRIPTION = Substr('description', 1, 6)
+
+# Columns ProjectDetailSerializer renders; of the joined owner profile and
+# user only the email is read
+DETAIL_FIELDS = (
+    'id', 'name', 'description', 'status', 'created', 'updated',
+    'owner_id', 'owner__user__email',
+)
+
+
+# Visible (not soft-deleted, via the default manager) tasks nested in
+# project detail responses, limited to the columns TaskSerializer renders
+# (plus the project FK the prefetch joins on)
+TASKS_PREFETCH = Prefetch(
+    'tasks',
+    queryset=Task.objects.only(
+        'id', 'project_id', 'title', 'description', 'assignee_id',
+        'created_by_id', 'status', 'priority', 'due_date', 'created', 'updated',
+    ),
+)
+
+
+def current_user_role(profile):
+    """
+    Subquery resolving `profile`'s membership role (viewers excluded) for
+    each project row; read by the project serializers' `role` field.
+    """
+    return Subquery(
+        ProjectMember.objects.filter(project=OuterRef('pk'), user=profile)
+        .exclude(role=ProjectMember.Role.VIEWER)
+        .values('role')[:1]
+    )
+
+
+class CurrentUserRoleMixin:
+    """
+    Annotates the requesting user's role on the view's queryset.
+
+    Anonymous users have no role, so nothing is annotated for them.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        user = self.request.user
+        if user.is_authenticated:
+            queryset = queryset.annotate(current_user_role=current_user_role(user.profile))
+        return queryset
+
+
+class PublicProjectsAPIView(CurrentUserRoleMixin, generics.ListAPIView):
     """
     API view that provides a paginated list of all public projects.
 
-    - Uses `ProjectsSerializer` to serialize project data.
+    - Uses `ProjectListSerializer` to serialize project data.
     - Accessible to any user (no authentication required).
     - Orders projects by creation date in descending order.
     - Pagination is handled by `DefaultPagination`.
     """
-    queryset = Project.objects.filter(status=Project.Visibility.PUBLIC).order_by('-created')
+    queryset = Project.objects.select_related('owner__user').only(
+        *LIST_FIELDS
+    ).annotate(
+        min_description_text=MIN_DESCRIPTION
+    ).filter(
+        status=Project.Visibility.PUBLIC
+    ).order_by('-created')
     permission_classes = [AllowAny]
     pagination_class = DefaultPagination
-    serializer_class = ProjectsSerializer
+    serializer_class = ProjectListSerializer
 
 
 class CreateProjectAPIView(generics.CreateAPIView):
@@ -48,73 +115,78 @@ class MyProjectsAPIView(generics.ListAPIView):
     API view that returns a paginated list of projects related to the authenticated user.
 
     - Requires user authentication (`IsAuthenticated`).
-    - Uses `ProjectsSerializer` to serialize project data.
+    - Uses `ProjectListSerializer` to serialize project data.
     - Pagination is handled by `DefaultPagination`.
     - Includes projects where:
         * The user is the owner, OR
         * The user is a member with roles: OWNER, ADMIN, or MEMBER.
-    - Prefetches membership information for the current user, excluding the VIEWER role.
-    - Results are distinct and ordered by creation date in descending order.
+    - Annotates the current user's membership role, excluding the VIEWER role.
+    - Results are ordered by creation date in descending order.
     """
 
     permission_classes = [IsAuthenticated]
     pagination_class = DefaultPagination
-    serializer_class = ProjectsSerializer
+    serializer_class = ProjectListSerializer
 
     def get_queryset(self):
         """
         Returns the queryset of projects associated with the authenticated user.
 
         - Filters projects by ownership or membership roles.
-        - Prefetches membership details for optimization.
-        - Ensures distinct results ordered by creation date.
+        - Annotates the current user's membership role in the same query.
+        - Orders results by creation date.
         """
         profile = self.request.user.profile
+        # Membership is matched with an IN subquery rather than a join, so
+        # each project appears once and no DISTINCT is needed
+        memberships = ProjectMember.objects.filter(
+            user=profile,
+            role__in=[
+                ProjectMember.Role.OWNER,
+                ProjectMember.Role.ADMIN,
+                ProjectMember.Role.MEMBER,
+            ],
+        ).values('project_id')
         projects = Project.objects.filter(
-            Q(owner=profile) |
-            Q(members__user=profile,
-              members__role__in=[
-                  ProjectMember.Role.OWNER,
-                  ProjectMember.Role.ADMIN,
-                  ProjectMember.Role.MEMBER,
-              ]),
-        ).prefetch_related(
-            Prefetch(
-                'members',
-                queryset=ProjectMember.objects.filter(user=profile)
-                .exclude(role=ProjectMember.Role.VIEWER),
-                to_attr='current_user_membership'
-            )
-        ).distinct().order_by('-created')
+            Q(owner=profile) | Q(id__in=Subquery(memberships)),
+        ).select_related('owner__user').only(*LIST_FIELDS).annotate(
+            min_description_text=MIN_DESCRIPTION,
+            # Resolved in the same query instead of a separate members prefetch
+            current_user_role=current_user_role(profile),
+        ).order_by('-created')
 
         return projects
 
 
-class PublicDetailProjectAPIView(generics.RetrieveAPIView):
+class PublicDetailProjectAPIView(CurrentUserRoleMixin, generics.RetrieveAPIView):
     """
     API view that retrieves detailed information about a single project.
 
     - Accessible to any user (no authentication required).
-    - Uses `ProjectsSerializer` to serialize project data.
+    - Uses `ProjectDetailSerializer` to serialize project data.
     - Operates on the full set of `Project` objects.
     """
-    serializer_class = ProjectsSerializer
+    serializer_class = ProjectDetailSerializer
     permission_classes = [AllowAny]
-    queryset = Project.objects.all()
+    queryset = Project.objects.select_related('owner__user').only(
+        *DETAIL_FIELDS
+    ).prefetch_related(TASKS_PREFETCH)
 
 
-class MyDetailProjectAPIView(generics.RetrieveUpdateDestroyAPIView):
+class MyDetailProjectAPIView(CurrentUserRoleMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     API view that allows authenticated users to retrieve, update, or delete a specific project.
 
     - Requires authentication (`IsAuthenticated`).
     - Additional permission check: user must be the owner or an admin member (`IsOwnerOrAdminMember`).
-    - Uses `ProjectsSerializer` to handle serialization.
+    - Uses `ProjectDetailSerializer` to handle serialization.
     - Operates on the full set of `Project` objects.
     """
-    serializer_class = ProjectsSerializer
+    serializer_class = ProjectDetailSerializer
     permission_classes = [IsAuthenticated, IsOwnerOrAdminMember]
-    queryset = Project.objects.all()
+    queryset = Project.objects.select_related('owner__user').only(
+        *DETAIL_FIELDS
+    ).prefetch_related(TASKS_PREFETCH)
 
 
 class ProjectInvitationAPIView(generics.GenericAPIView):
@@ -144,57 +216,65 @@ class ProjectInvitationAPIView(generics.GenericAPIView):
         serializer = self.get_serializer(data=request.data)
         if serializer.is_valid():
             email = serializer.validated_data['email']
-            profile = get_object_or_404(Profile, user__email=email)
+            profile = serializer.validated_data['invitee']
             full_name = profile.get_full_name()
 
-            try:
-                # Save invitation object
-                invitation = serializer.save()
-
-                # Prepare response data
-                data = {
-                    "detail": "Your invitation letter has been sent.",
-                    "email": email,
-                    "full_name": full_name,
-                }
-
-                # Generate activation token for invited user
-                token = self.get_token_for_user(profile.user, invitation)
-
-                # Send invitation email asynchronously
-                send_registration_email.apply_async(kwargs={
-                    "token": token,
-                    "full_name": full_name,
-                    "email": email,
-                })
-
-                return Response(data=data, status=status.HTTP_201_CREATED)
-
-            except Exception as e:
-                # Rollback invitation if error occurs
-                ProjectInvitation.objects.get(invitee=profile).delete()
-                print(f"error: {str(e)}")
-
-                return Response(
-                    {"detail": "An error occurred, please try again later and call to admins"},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                )
+            # Invitation INSERT is discarded if sending fails
+            with transaction.atomic():
+                try:
+                    # Save invitation object
+                    invitation = serializer.save()
+
+                    # Prepare response data
+                    data = {
+                        "detail": "Your invitation letter has been sent.",
+                        "email": email,
+                        "full_name": full_name,
+                    }
+
+                    # Generate activation token for invited user
+                    token = self.get_token_for_user(profile.user, invitation)
+
+                    # Send invitation email asynchronously; queued before commit so
+                    # a broker failure rolls the invitation back (the task does not
+                    # read the invitation, and there is no resend for it)
+                    send_registration_email.apply_async(kwargs={
+                        "token": token,
+                        "full_name": full_name,
+                        "email": email,
+                    })
+
+                    return Response(data=data, status=status.HTTP_201_CREATED)
+
+                except Exception as e:
+                    # Rollback invitation if error occurs
+                    transaction.set_rollback(True)
+                    print(f"error: {str(e)}")
+
+                    return Response(
+                        {"detail": "An error occurred, please try again later and call to admins"},
+                        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    )
 
         # Return validation errors
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
     def get_token_for_user(self, user, invitation):
         """
-        Generates an access token for account activation.
+        Generates a signed token for accepting the invitation.
 
-        - Token includes invitation ID, role, and project ID.
-        - Uses `RefreshToken` to generate the access token.
+        - Token includes user ID, invitation ID, role, and project ID.
+        - Signed directly with PyJWT in the format `AcceptInvitationAPIView`
+          decodes; unlike a SimpleJWT access token it cannot be used to log in.
         """
-        refresh = RefreshToken.for_user(user)
-        refresh['invitation_id'] = str(invitation.id)
-        refresh['role'] = invitation.role
-        refresh['project_id'] = str(invitation.project.id)
-        return str(refresh.access_token)
+        payload = {
+            'user_id': str(user.id),
+            'invitation_id': str(invitation.id),
+            'role': invitation.role,
+            'project_id': str(invitation.project_id),
+            'exp': timezone.now() + settings.INVITATION_TOKEN_LIFETIME,
+        }
+        return jwt.encode(payload, settings.SECRET_KEY, algorithm='HS256')
 
 
 class AcceptInvitationAPIView(generics.GenericAPIView):
@@ -244,26 +324,39 @@ class AcceptInvitationAPIView(generics.GenericAPIView):
             )
 
         try:
-            # Fetch invitation from the database
-            invitation = ProjectInvitation.objects.get(
+            # Fetch invitation with its project and invitee in one query
+            invitation = ProjectInvitation.objects.select_related(
+                'project', 'invitee'
+            ).get(
                 id=invitation_id,
+                project_id=project_id,
                 status=ProjectInvitation.Status.PENDING
             )
 
-            # Fetch project and profile
-            project = get_object_or_404(Project, id=project_id)
-            profile = get_object_or_404(Profile, pk=user_id)
+            project = invitation.project
+            profile = invitation.invitee
 
-            # Create ProjectMember with specified role
-            member = ProjectMember.objects.create(
-                project=project,
-                user=profile,
-                role=role
-            )
+            # The token must belong to the invited user
+            if str(profile.user_id) != str(user_id):
+                raise ProjectInvitation.DoesNotExist
 
-            # Update invitation status to ACCEPTED
-            invitation.status = ProjectInvitation.Status.ACCEPTED
-            invitation.save()
+            with transaction.atomic():
+                # Create ProjectMember with specified role
+                member = ProjectMember.objects.create(
+                    project=project,
+                    user=profile,
+                    role=role
+                )
+
+                # Update invitation status to ACCEPTED, only if still pending
+                updated = ProjectInvitation.objects.filter(
+                    id=invitation.id,
+                    status=ProjectInvitation.Status.PENDING
+                ).update(status=ProjectInvitation.Status.ACCEPTED)
+
+                # Processed concurrently: drop the member created above
+                if not updated:
+                    raise ProjectInvitation.DoesNotExist
 
             return Response({
                 "detail": "Invitation accepted successfully",
@@ -314,14 +407,25 @@ class RejectInvitationAPIView(generics.GenericAPIView):
             )
 
         try:
-            invitation = ProjectInvitation.objects.get(pk=invitation_id)
-            invitation.status = ProjectInvitation.Status.REVOKED
+            # Revoke in a single UPDATE; only the invitee's pending invitation matches
+            updated = ProjectInvitation.objects.filter(
+                pk=invitation_id,
+                invitee__user_id=user_id,
+                status=ProjectInvitation.Status.PENDING
+            ).update(status=ProjectInvitation.Status.REVOKED)
+
+            if not updated:
+                raise ProjectInvitation.DoesNotExist
+
             return Response({
                 "detail": "Invitation revoked successfully",
             })
 
         except ProjectInvitation.DoesNotExist:
-            return Response({"detail": "Invitation not found or already processed"},)
+            return Response(
+                {"detail": "Invitation not found or already processed"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
 
         except Exception as e:
             print(f"Error rejecting invitation: {str(e)}")
@@ -0,0 +1,24 @@
+# Generated by Django 5.2 on 2026-10-15 01:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0005_user_unverified_created_index"),
+        ("manager", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="projectmember",
+            name="manager_pro_user_id_69cb16_idx",
+        ),
+        migrations.AddIndex(
+            model_name="projectmember",
+            index=models.Index(
+                fields=["user", "role"], name="manager_pro_user_id_017387_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2 on 2026-10-15 01:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0005_user_unverified_created_index"),
+        ("manager", "0002_projectmember_user_role_idx"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="task",
+            name="manager_tas_project_513f98_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="task",
+            name="manager_tas_assigne_1593e2_idx",
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["project", "status"],
+                name="task_active_proj_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["assignee", "status"],
+                name="task_active_asg_status_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2 on 2026-10-15 01:10
+
+import manager.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manager", "0003_task_active_partial_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="project",
+            name="id",
+            field=models.UUIDField(
+                default=manager.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="projectinvitation",
+            name="id",
+            field=models.UUIDField(
+                default=manager.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="projectmember",
+            name="id",
+            field=models.UUIDField(
+                default=manager.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="task",
+            name="id",
+            field=models.UUIDField(
+                default=manager.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
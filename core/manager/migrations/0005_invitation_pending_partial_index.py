@@ -0,0 +1,26 @@
+# Generated by Django 5.2 on 2026-10-15 01:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0005_user_unverified_created_index"),
+        ("manager", "0004_uuid7_primary_keys"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="projectinvitation",
+            name="manager_pro_invitee_ad181f_idx",
+        ),
+        migrations.AddIndex(
+            model_name="projectinvitation",
+            index=models.Index(
+                condition=models.Q(("status", "pending")),
+                fields=["invitee"],
+                name="invite_pending_by_user",
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-15 01:12
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("manager", "0005_invitation_pending_partial_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="projectmember",
+            name="manager_pro_project_c0965e_idx",
+        ),
+    ]
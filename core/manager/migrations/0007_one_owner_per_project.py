@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-15 01:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0005_user_unverified_created_index"),
+        ("manager", "0006_drop_projectmember_project_user_idx"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="projectmember",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("role", "owner")),
+                fields=("project",),
+                name="one_owner_per_project",
+            ),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2 on 2026-10-15 01:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0005_user_unverified_created_index"),
+        ("manager", "0007_one_owner_per_project"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="project",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("status__in", ["private", "public", "closed"])),
+                name="project_status_valid",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="projectinvitation",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("status__in", ["pending", "accepted", "revoked", "expired"])
+                ),
+                name="invitation_status_valid",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="projectinvitation",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("role__in", ["owner", "admin", "member", "viewer"])
+                ),
+                name="invitation_role_valid",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="projectmember",
+            constraint=models.CheckConstraint(
+                condition=models.Q(
+                    ("role__in", ["owner", "admin", "member", "viewer"])
+                ),
+                name="member_role_valid",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="task",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("status__in", ["todo", "in_progress", "done"])),
+                name="task_status_valid",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="task",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("priority__in", ["low", "medium", "high"])),
+                name="task_priority_valid",
+            ),
+        ),
+    ]
@@ -1,23 +1,29 @@
-import uuid
 from django.db import models
 from django.urls import reverse
 from account.models.profiles import Profile
+from .utils import uuid7
 
 
 # =========================
 # Project Model
 # =========================
+# Choice enums live at module level so the CHECK constraints in each
+# model's Meta can use their values (nested classes are not in scope there)
+
+# Controls project visibility and accessibility
+class ProjectVisibility(models.TextChoices):
+    PRIVATE = ("private", "Private")
+    PUBLIC = ("public", "Public")
+    CLOSED = ("closed", "Closed")
+
+
 # Represents a project container that groups tasks and members together
 class Project(models.Model):
 
-    # Controls project visibility and accessibility
-    class Visibility(models.TextChoices):
-        PRIVATE = ("private", "Private")
-        PUBLIC = ("public", "Public")
-        CLOSED = ("closed", "Closed")
+    Visibility = ProjectVisibility
 
-    # Use UUID as primary key for better security and scalability
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Time-ordered UUID primary key: opaque in URLs, appended in index order
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
 
     # Basic project information
     name = models.CharField(max_length=100)
@@ -57,27 +63,50 @@ class Project(models.Model):
             models.Index(fields=["name"]),
         ]
 
+        # Choice values enforced by the database too
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(status__in=ProjectVisibility.values),
+                name="project_status_valid",
+            ),
+        ]
+
+
+# =========================
+# Task Managers
+# =========================
+# Default manager: soft-deleted tasks are hidden everywhere unless
+# Task.all_objects is used explicitly
+class ActiveTaskManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().filter(is_deleted=False)
+
 
 # =========================
 # Task Model
 # =========================
+# Task workflow states
+class TaskStatus(models.TextChoices):
+    TODO = ("todo", "To Do")
+    IN_PROGRESS = ("in_progress", "In Progress")
+    DONE = ("done", "Done")
+
+
+# Task priority levels
+class TaskPriority(models.TextChoices):
+    LOW = ("low", "Low")
+    MEDIUM = ("medium", "Medium")
+    HIGH = ("high", "High")
+
+
 # Represents an actionable unit inside a project
 class Task(models.Model):
 
-    # Task workflow states
-    class Status(models.TextChoices):
-        TODO = ("todo", "To Do")
-        IN_PROGRESS = ("in_progress", "In Progress")
-        DONE = ("done", "Done")
-
-    # Task priority levels
-    class Priority(models.TextChoices):
-        LOW = ("low", "Low")
-        MEDIUM = ("medium", "Medium")
-        HIGH = ("high", "High")
+    Status = TaskStatus
+    Priority = TaskPriority
 
     # UUID primary key
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
 
     # Parent project
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="tasks")
@@ -111,12 +140,19 @@ class Task(models.Model):
     created = models.DateTimeField(auto_now_add=True)
     updated = models.DateTimeField(auto_now=True)
 
-    # Soft delete fields (task is hidden, not removed from DB)
+    # Soft delete fields (task is hidden, not removed from DB);
+    # is_deleted is the filter column, deleted_at is audit-only
     is_deleted = models.BooleanField(default=False)
     deleted_at = models.DateTimeField(null=True, blank=True)
 
+    # Visible tasks only (also used by project.tasks); all_objects
+    # includes soft-deleted rows
+    objects = ActiveTaskManager()
+    all_objects = models.Manager()
+
     def __str__(self):
-        assignee = self.assignee.first_name if self.assignee else "Unassigned"
+        # Checks the FK column first, so unassigned tasks never query Profile
+        assignee = self.assignee.first_name if self.assignee_id else "Unassigned"
         return f"{self.title} assigned to ({assignee})"
 
     # Canonical URL for task detail endpoint
@@ -127,36 +163,58 @@ class Task(models.Model):
         # Default ordering (upcoming tasks first)
         ordering = ("due_date", "priority", "created")
 
-        # Optimized indexes for frequent filtering
+        # Optimized indexes for frequent filtering; project and assignee
+        # lookups only ever read visible tasks, so soft-deleted rows are
+        # left out of those indexes
         indexes = [
-            models.Index(fields=["project", "status"]),
-            models.Index(fields=["assignee", "status"]),
+            models.Index(
+                fields=["project", "status"],
+                condition=models.Q(is_deleted=False),
+                name="task_active_proj_status_idx",
+            ),
+            models.Index(
+                fields=["assignee", "status"],
+                condition=models.Q(is_deleted=False),
+                name="task_active_asg_status_idx",
+            ),
             models.Index(fields=["created", "status"]),
         ]
 
-        # Prevent invalid due dates (must be >= creation time)
+        # Prevent invalid due dates (must be >= creation time) and
+        # status / priority values outside Status and Priority
         constraints = [
             models.CheckConstraint(
-                check=models.Q(due_date__gte=models.F("created")),
+                condition=models.Q(due_date__gte=models.F("created")),
                 name="due_date_after_created",
-            )
+            ),
+            models.CheckConstraint(
+                condition=models.Q(status__in=TaskStatus.values),
+                name="task_status_valid",
+            ),
+            models.CheckConstraint(
+                condition=models.Q(priority__in=TaskPriority.values),
+                name="task_priority_valid",
+            ),
         ]
 
 
 # =========================
 # Project Membership Model
 # =========================
+# Role-based access control
+class MemberRole(models.TextChoices):
+    OWNER = ("owner", "Owner")
+    ADMIN = ("admin", "Admin")
+    MEMBER = ("member", "Member")
+    VIEWER = ("viewer", "Viewer")
+
+
 # Defines which users have access to a project and with what role
 class ProjectMember(models.Model):
 
-    # Role-based access control
-    class Role(models.TextChoices):
-        OWNER = ("owner", "Owner")
-        ADMIN = ("admin", "Admin")
-        MEMBER = ("member", "Member")
-        VIEWER = ("viewer", "Viewer")
+    Role = MemberRole
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
 
     # Related project
     project = models.ForeignKey(
@@ -178,9 +236,25 @@ class ProjectMember(models.Model):
         # Ensure a user can only have one role per project
         unique_together = ("project", "user")
 
+        # A project has exactly one owner membership (created with it),
+        # and roles are limited to Role values
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project"],
+                condition=models.Q(role="owner"),
+                name="one_owner_per_project",
+            ),
+            models.CheckConstraint(
+                condition=models.Q(role__in=MemberRole.values),
+                name="member_role_valid",
+            ),
+        ]
+
+        # (project, user) lookups use the unique_together index
         indexes = [
-            models.Index(fields=["project", "user"]),
-            models.Index(fields=["user"]),
+            # "My projects" filters by user and role; the user prefix still
+            # serves plain per-user lookups
+            models.Index(fields=["user", "role"]),
         ]
 
     def __str__(self):
@@ -190,17 +264,20 @@ class ProjectMember(models.Model):
 # =========================
 # Project Invitation Model
 # =========================
+# Invitation lifecycle states
+class InvitationStatus(models.TextChoices):
+    PENDING = ("pending", "Pending")
+    ACCEPTED = ("accepted", "Accepted")
+    REVOKED = ("revoked", "Revoked")
+    EXPIRED = ("expired", "Expired")
+
+
 # Handles access requests sent to existing users
 class ProjectInvitation(models.Model):
 
-    # Invitation lifecycle states
-    class Status(models.TextChoices):
-        PENDING = ("pending", "Pending")
-        ACCEPTED = ("accepted", "Accepted")
-        REVOKED = ("revoked", "Revoked")
-        EXPIRED = ("expired", "Expired")
+    Status = InvitationStatus
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
 
     # Target project
     project = models.ForeignKey(
@@ -236,8 +313,26 @@ class ProjectInvitation(models.Model):
         # Prevent duplicate invitations for same user & project
         unique_together = ("project", "invitee")
 
+        # Status and role limited to Status and ProjectMember.Role values
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(status__in=InvitationStatus.values),
+                name="invitation_status_valid",
+            ),
+            models.CheckConstraint(
+                condition=models.Q(role__in=MemberRole.values),
+                name="invitation_role_valid",
+            ),
+        ]
+
         indexes = [
-            models.Index(fields=["invitee", "status"]),
+            # "Pending invitations for this user"; answered invitations
+            # are left out so the index stays small as they accumulate
+            models.Index(
+                fields=["invitee"],
+                condition=models.Q(status="pending"),
+                name="invite_pending_by_user",
+            ),
             models.Index(fields=["project"]),
             models.Index(fields=["created"]),
         ]
@@ -3,8 +3,11 @@ from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
 from django.conf import settings
 
+from core.mail import send_email
 
-@shared_task
+
+# Nothing reads the result, so skip storing it in the result backend
+@shared_task(ignore_result=True)
 def send_registration_email(token, full_name, email):
     """
     Celery task to send a project invitation email.
@@ -37,5 +40,5 @@ def send_registration_email(token, full_name, email):
     # Attach HTML version of the email
     email_obj.attach_alternative(html_content, "text/html")
 
-    # Send the email
-    email_obj.send()
\ No newline at end of file
+    # Send the email over the worker's shared SMTP connection
+    send_email(email_obj)
\ No newline at end of file
@@ -1,3 +1,93 @@
 from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from account.models import User
+from .api.v1.views import ProjectInvitationAPIView
+from .models import Project, ProjectInvitation, ProjectMember
+
+
+class InvitationResponseTests(TestCase):
+    """
+    Accepting and rejecting invitations only moves a pending invitation.
+    """
+
+    accept_url = "/manager/api/v1/invition/accept/confirm/{}/"
+    reject_url = "/manager/api/v1/invition/reject/confirm/{}/"
+
+    def setUp(self):
+        owner = User.objects.create_user(email="owner@example.com", password="x")
+        self.invitee = User.objects.create_user(email="invitee@example.com", password="x")
+        self.project = Project.objects.create(
+            name="Project", description="Description", owner=owner.profile
+        )
+        ProjectMember.objects.create(
+            project=self.project, user=owner.profile, role=ProjectMember.Role.OWNER
+        )
+        self.invitation = ProjectInvitation.objects.create(
+            project=self.project,
+            invitee=self.invitee.profile,
+            invited_by=owner.profile,
+            role=ProjectMember.Role.ADMIN,
+        )
+        self.token = ProjectInvitationAPIView().get_token_for_user(
+            self.invitee, self.invitation
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.invitee)
+
+    def assertInvitationStatus(self, expected):
+        self.invitation.refresh_from_db()
+        self.assertEqual(self.invitation.status, expected)
+
+    def memberships(self):
+        return ProjectMember.objects.filter(
+            project=self.project, user=self.invitee.profile
+        )
+
+    def test_accept_creates_membership_once(self):
+        response = self.client.get(self.accept_url.format(self.token))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertInvitationStatus(ProjectInvitation.Status.ACCEPTED)
+        self.assertEqual(
+            list(self.memberships().values_list("role", flat=True)),
+            [ProjectMember.Role.ADMIN],
+        )
+
+        response = self.client.get(self.accept_url.format(self.token))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.memberships().count(), 1)
+
+    def test_reject_revokes_once(self):
+        response = self.client.get(self.reject_url.format(self.token))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertInvitationStatus(ProjectInvitation.Status.REVOKED)
+
+        response = self.client.get(self.reject_url.format(self.token))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_rejected_invitation_cannot_be_accepted(self):
+        self.client.get(self.reject_url.format(self.token))
+
+        response = self.client.get(self.accept_url.format(self.token))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertInvitationStatus(ProjectInvitation.Status.REVOKED)
+        self.assertFalse(self.memberships().exists())
+
+    def test_token_of_another_user_is_refused(self):
+        other = User.objects.create_user(email="other@example.com", password="x")
+        token = ProjectInvitationAPIView().get_token_for_user(other, self.invitation)
+
+        for url in (self.accept_url, self.reject_url):
+            with self.subTest(url=url):
+                response = self.client.get(url.format(token))
+
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+                self.assertInvitationStatus(ProjectInvitation.Status.PENDING)
+
+        self.assertFalse(self.memberships().exists())
@@ -0,0 +1,19 @@
+import os
+import time
+import uuid
+
+
+# time-ordered UUID (version 7, RFC 9562) used as primary key default:
+# a 48-bit unix timestamp in milliseconds followed by random bits, so new
+# rows are appended at the right-most leaf of the primary key index
+def uuid7():
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand_a = int.from_bytes(os.urandom(2), "big") & 0x0FFF
+    rand_b = int.from_bytes(os.urandom(8), "big") & 0x3FFF_FFFF_FFFF_FFFF
+
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # version
+    value |= rand_a << 64
+    value |= 0b10 << 62  # RFC 4122 variant
+    value |= rand_b
+    return uuid.UUID(int=value)